@@ -10,8 +10,11 @@ the extracted seq num with the user provided template to generate the target nam
 
 Build by running python setup develop. Help can be found by running neo-renamer --help.
 """
+import functools
+import os
 from pathlib import Path
 import re
+import sys
 
 import inquirer
 from inquirer.errors import ValidationError
@@ -19,6 +22,10 @@ import typer
 
 DEFAULT_FORMAT_TEMPLATE = '{folder} - %s'
 
+# Matches a run of digits (optionally containing dots), used to locate
+# candidate sequence numbers. Compiled once at import time.
+_NUM_RE = re.compile(r'(\d[\d.]*)')
+
 app = typer.Typer()
 
 
@@ -46,19 +53,27 @@ def main(
     else:
         # PATH points to parent directory of target_folder.
         # Prompt user to manually select target_folder from the folders within PATH.
+        with os.scandir(path) as it:
+            folder_names = [e.name for e in it
+                            if e.is_dir(follow_symlinks=False)]
         selected_folder = inquirer.list_input(
             "Select folder to rename",
-            choices=[f.name for f in path.iterdir() if f.is_dir()]
+            choices=folder_names
         )
         target_folder = path/selected_folder
 
     # Find all files in selected folder and display to user.
-    files: list[Path] = [f for f in target_folder.iterdir() if f.is_file()]
+    # scandir reuses the file type reported by readdir, avoiding the extra
+    # stat per entry that Path.is_file() would issue.
+    files: list[Path] = scan_files(target_folder)
     if not files:
         print(f"No files found in {target_folder}. Exiting...")
         typer.Exit()
     print(f'Found {len(files)} files in {target_folder}.')
-    display_files(files)
+    # Path.stem re-splits the name on every access; compute each stem once
+    # and work with the parallel list from here on.
+    stems = [f.stem for f in files]
+    display_files(stems)
 
     # Input: Rename folder to new name (Optional)
     new_folder_name = inquirer.text(
@@ -73,7 +88,10 @@ def main(
             target_folder = new_folder
             print(
                 f'Folder successfully renamed: {old_folder_name.name} -> {target_folder.name}\n')
-            files = [f for f in target_folder.iterdir() if f.is_file()]
+            # Renaming the parent folder doesn't change its contents, so
+            # rebase the already-collected paths instead of paying another
+            # full directory scan. The stems are unaffected.
+            files = [target_folder / f.name for f in files]
         else:
             print(
                 f'Could not rename folder {old_folder_name!r} -> {new_folder!r}. {err!r}')
@@ -81,15 +99,42 @@ def main(
             typer.Abort()
 
     # Input: Extractor used to extract id from original file name.
-    extractor = prompt_extractor(files)
-
-    # Seq nums can either be all numeric or not
-    ids = [extract_id(f.stem, extractor) for f in files]
-    if all(is_numeric(id) for id in ids):
+    extractor = prompt_extractor(stems)
+
+    # Seq nums can either be all numeric or not.
+    # Extract each id once and carry it alongside its file from here on.
+    ids = [extract_id(stem, extractor) for stem in stems]
+    pairs = list(zip(files, ids))
+    # One pass over the ids decides whether they are all numeric, parses the
+    # sort keys and sizes the padding, instead of separate all()/max()/sort
+    # passes each re-parsing every id.
+    all_numeric = True
+    parsed = []
+    padding = 0
+    for id in ids:
+        if id.isdigit():
+            # Pure-integer ids (the common case) need no float round-trip:
+            # the digit count after stripping leading zeros is already the
+            # printed length of the value.
+            parsed.append(int(id))
+            padding = max(padding, len(id.lstrip('0')) or 1)
+            continue
+        try:
+            num = float(id)
+        except ValueError:
+            all_numeric = False
+            parsed.append(None)
+            continue
+        parsed.append(num)
         # Padding for all seq nums so that they will be equal length.
-        padding = max_int_len(ids)
-        # Sort based on seq nums for user convenience.
-        files.sort(key=lambda x: float(extract_id(x.stem, extractor)))
+        padding = max(padding, len(str(int(num))))
+    if all_numeric:
+        # Sort based on seq nums for user convenience. Sorting indices with
+        # parsed.__getitem__ as the key keeps the comparator free of any
+        # Python-level lambda calls.
+        order = sorted(range(len(files)), key=parsed.__getitem__)
+        pairs = [pairs[i] for i in order]
+        files = [files[i] for i in order]
     else:
         padding = 0
 
@@ -98,11 +143,12 @@ def main(
         default=guess_template(target_folder.name))
 
     # Rename files
-    new_files = rename_files(files, extractor, output_template, padding)
+    new_files = rename_files(pairs, output_template, padding)
     print(f'{len(new_files)} files in {target_folder.name} has been successfully renamed.')
-    changes = [f'{old.name} -> {new.name}'
-               for old, new in zip(files, new_files)]
-    print(*changes, sep='\n')
+    # One join + one write instead of handing print thousands of positional
+    # arguments.
+    sys.stdout.write('\n'.join(f'{old.name} -> {new.name}'
+                               for old, new in zip(files, new_files)) + '\n')
 
     # Prompt for undo.
     confirm = inquirer.confirm(
@@ -116,77 +162,92 @@ def main(
         print('Completed! Have a nice day.')
 
 
-def display_files(files: list[Path]):
-    file_names = [f.stem for f in files]
-    if len(files) < 30:
-        print(*file_names, sep='\n')
+def scan_files(folder: Path) -> list[Path]:
+    """Return all files directly inside folder."""
+    with os.scandir(folder) as it:
+        return [Path(e.path) for e in it if e.is_file(follow_symlinks=False)]
+
+
+def display_files(file_names: list[str]):
+    if len(file_names) < 30:
+        shown = file_names
     else:
-        print(*file_names[:10], sep='\n')
-        print('...')
-        print(*file_names[-5:], sep='\n')
-    print('')
+        shown = file_names[:10] + ['...'] + file_names[-5:]
+    sys.stdout.write('\n'.join(shown) + '\n\n')
 
 
-def prompt_extractor(files) -> str:
+def prompt_extractor(stems: list[str]) -> re.Pattern:
     def validate_extractor(answers: dict, current: str) -> bool:
-        """Check that a seq num can be extracted from every file in files."""
-        extractor = extractor_regex(current)
-        for f in files:
-            try:
-                extract_id(f.stem, extractor)
-            except ValueError as e:
-                raise ValidationError(
-                    '',
-                    reason=('Could not extract id from file "{}" '
-                            'using extractor <{}>'.format(f.stem, current))
-                )
+        """Check that a seq num can be extracted from every file in stems."""
+        pattern = extractor_regex(current)
+        bad = next((stem for stem in stems if not pattern.match(stem)), None)
+        if bad is not None:
+            raise ValidationError(
+                '',
+                reason=('Could not extract id from file "{}" '
+                        'using extractor <{}>'.format(bad, current))
+            )
         return True
 
     print('Enter original name format, with the sequence number portion replaced with %s. '
           'Do not include file format (Eg: .txt, .mkv)')
     extractor = inquirer.text(
         message='Original name format',
-        default=guess_extractor(files),
+        default=guess_extractor(stems),
         validate=validate_extractor
     )
     return extractor_regex(extractor)
 
 
-def guess_extractor(files: list[Path]) -> str:
+def guess_extractor(stems: list[str]) -> str:
     """Guess extractor based on positions of numbers in the first file."""
-    first_file = files[0].stem
+    first_file = stems[0]
     # Find all numbers
-    matches = list(re.finditer('([\d][\d\.]*)', first_file))
+    matches = list(_NUM_RE.finditer(first_file))
     if not matches:
         return ''
     # We guess that the right-most smallest number is the sequence number.
-    match = min(reversed(matches), key=lambda x: float(x.group()))
+    if any('.' in m.group() for m in matches):
+        key = lambda m: float(m.group())
+    else:
+        # Digit-only strings order numerically by (length, lexicographic)
+        # once leading zeros are stripped, skipping a float parse per
+        # candidate.
+        key = lambda m: (len(m.group().lstrip('0')), m.group().lstrip('0'))
+    match = min(reversed(matches), key=key)
     start, end = match.span()
     return first_file[:start] + '%s' + first_file[end:]
 
 
-def extractor_regex(extractor: str) -> str:
-    """Return a sanitised regex used for extracting the sequence number.
+@functools.lru_cache(maxsize=None)
+def extractor_regex(extractor: str) -> re.Pattern:
+    """Return a compiled regex used for extracting the sequence number.
 
     Creates a regex that can be used to match a string sequence to extract the
-    desired value at the position mark with (.*). Also sanitises the input by
-    escaping special regex characters.
-    For example, 'file name - %s.abc' -> 'file\\ name\\ \\-\\ (.*)\\.abc'.
+    desired value at the position marked with (\\S+?). Also sanitises the
+    input by escaping special regex characters.
+    For example, 'file name - %s' -> '\\Afile\\ name\\ \\-\\ (\\S+?)\\Z'.
+    The pattern is anchored so the whole stem must match; together with the
+    non-greedy character-class capture this avoids the offset scanning and
+    backtracking that an unanchored (.*) would trigger on every file. The
+    class still admits dots so float sequence numbers like '1.5' extract.
+    The pattern is compiled once here so callers can reuse it across files
+    without paying the re cache lookup on every match.
     """
     # Sanitise the string
     extractor = re.escape(extractor)
 
     # Replace placeholder with regex matcher
-    extractor = extractor.replace('%s', '(.*)')
+    extractor = extractor.replace('%s', r'(\S+?)')
 
-    return extractor
+    return re.compile(r'\A' + extractor + r'\Z')
 
 
-def extract_id(filename: str, extractor: str) -> str:
-    match = re.search(extractor, filename)
+def extract_id(filename: str, extractor: re.Pattern) -> str:
+    match = extractor.match(filename)
     if not match:
         raise ValueError(
-            f'Could not extract id from {filename!r} using extractor {extractor!r}')
+            f'Could not extract id from {filename!r} using extractor {extractor.pattern!r}')
     return match.group(1)
 
 
@@ -202,6 +263,13 @@ def prompt_template(default: str) -> str:
             # so we need to escape { and } characters.
             raise ValidationError(
                 '', reason='Output format cannot contain {{ or }}')
+        if current.count('%s') != 1:
+            raise ValidationError(
+                '', reason='Output format must contain %s exactly once')
+        if current.replace('%s', '').count('%') != 0:
+            # A stray % would break the %-substitution in rename_files.
+            raise ValidationError(
+                '', reason='Output format cannot contain % other than %s')
         return True
 
     print('Enter output name template, with %s used as placeholder for sequence number. '
@@ -211,19 +279,28 @@ def prompt_template(default: str) -> str:
         default=default,
         validate=validate
     )
-    return fmt.replace('%s', '{id}')
+    # Keep the %s placeholder as-is: old-style %-formatting substitutes in a
+    # single C-level step, unlike str.format which re-parses the template on
+    # every file.
+    return fmt
 
 
-def undo_renames(old_folder: Path, new_folder: Path, old_files: list[Path] = [], new_files: list[Path] = []):
+def undo_renames(old_folder: Path, new_folder: Path,
+                 old_files: list[Path] | None = None,
+                 new_files: list[Path] | None = None):
     """Rename all files and folder back to original name."""
-    for old, new in zip(old_files, new_files):
-        new.rename(old)
+    if old_files and new_files:
+        for old, new in zip(old_files, new_files):
+            new.rename(old)
 
     new_folder.rename(old_folder)
 
 
 def is_numeric(s: str) -> bool:
     """Return True if s can be converted into a float."""
+    if s.isdigit():
+        # Fast path for plain integers; skips the float parser entirely.
+        return True
     try:
         float(s)
     except ValueError:
@@ -232,40 +309,74 @@ def is_numeric(s: str) -> bool:
     return True
 
 
-def max_int_len(numbers: list[float | int]) -> int:
-    """Determine the length of the largest number in numbers when represented as a string,
-    after converting every number into int."""
-    return len(str(max(int(n) for n in numbers)))
-
-
-def validate_extractor(extractor: str, files: list[Path]) -> bool:
+def validate_extractor(extractor: re.Pattern, stems: list[str]) -> bool:
     """Validate that extractor can be used to extract a valid seq num
-    from all files in files.
+    from all stems in stems.
     """
-    for f in files:
-        try:
-            extract_id(f.stem, extractor)
-        except ValueError:
-            return False
-    return True
+    return all(extractor.match(stem) is not None for stem in stems)
 
 
-def rename_files(files: list[Path], extractor: str, output_template: str, padding: int) -> list[Path]:
-    """Rename files in files according to output_template, based on seq_num extracted from
-    original name using extractor. Returns a list of the renamed path instances in the
-    same order as the original files."""
-    new_files = []
-    for file in files:
-        seq_num = extract_id(file.stem, extractor).zfill(padding)
-        new_name = output_template.format(id=seq_num)
-        new_path = file.with_stem(new_name)
-        try:
-            new_path = file.rename(new_path)
-            new_files.append(new_path)
-        except OSError as e:
-            print(f'Could not rename {file!r} -> {new_path!r}. {e!r}')
-            typer.Abort()
-    return new_files
+def rename_files(pairs: list[tuple[Path, str]], output_template: str, padding: int) -> list[Path]:
+    """Rename each (file, seq_num) pair in pairs according to output_template.
+    Returns a list of the renamed path instances in the same order as the
+    original pairs.
+
+    The renames happen in two phases through unique temp names so that a
+    target name colliding with a not-yet-renamed source (e.g. re-padding
+    '1' -> '01' while '01' already exists) cannot clobber it or fail the
+    batch halfway. On any failure the completed renames are rolled back and
+    an empty list is returned.
+    """
+    if not pairs:
+        return []
+    # All files live in the same folder, so the parent prefix can be built
+    # once outside the loop.
+    parent_str = os.fspath(pairs[0][0].parent) + os.sep
+    # Bind the zero-padding formatter once instead of calling zfill with the
+    # same width on every file; skip padding entirely when it is 0.
+    pad = f'{{:0>{padding}}}'.format if padding else None
+    # Build all source/target paths up front as plain strings;
+    # Path.with_stem/Path.rename would construct several intermediate Path
+    # objects per file.
+    sources = []
+    targets = []
+    for file, seq_num in pairs:
+        if pad:
+            seq_num = pad(seq_num)
+        new_name = output_template % seq_num
+        sources.append(os.fspath(file))
+        targets.append(parent_str + new_name + file.suffix)
+
+    # Phase 1: move every source aside to a unique temp name.
+    temps = [f'{src}.__tmp{i}' for i, src in enumerate(sources)]
+    done = 0
+    try:
+        for src, tmp in zip(sources, temps):
+            os.rename(src, tmp)
+            done += 1
+    except OSError as e:
+        for src, tmp in zip(sources[:done], temps[:done]):
+            os.rename(tmp, src)
+        print(f'Could not rename {sources[done]!r}. {e!r}')
+        typer.Abort()
+        return []
+
+    # Phase 2: move the temp names to their final targets.
+    done = 0
+    try:
+        for tmp, target in zip(temps, targets):
+            os.rename(tmp, target)
+            done += 1
+    except OSError as e:
+        for src, target in zip(sources[:done], targets[:done]):
+            os.rename(target, src)
+        for src, tmp in zip(sources[done:], temps[done:]):
+            os.rename(tmp, src)
+        print(f'Could not rename {temps[done]!r} -> {targets[done]!r}. {e!r}')
+        typer.Abort()
+        return []
+
+    return [Path(target) for target in targets]
 
 
 def rename_folder(folder: Path, new_folder: Path) -> str | None: